@@ -14,7 +14,9 @@ CloudFormation Events:
   updated document, and verifies the policy engine is still attached to the
   gateway. Uses a shared helper (_delete_managed_policies) that handles stale
   policy IDs from the PhysicalResourceId by listing and deleting all policies
-  matching the managed policy naming convention.
+  matching the managed policy naming convention. If none of the policy
+  properties changed and a usable managed policy exists, that policy is kept
+  and only the attachment check runs.
 - Delete: Detaches policy engine from gateway, deletes all managed policies,
   and deletes the policy engine
 
@@ -22,26 +24,91 @@ Waiter Strategy:
 - Policy creation uses the policy_active waiter. Policy deletion uses the
   policy_deleted waiter. Policy Engine creation uses the policy_engine_active
   waiter. Policy Engine deletion uses the policy_engine_deleted waiter.
-- Gateway operations currently use a custom polling loop as the
-  bedrock-agentcore-control service does not provide an official
-  waiter for gateway status changes.
+- Gateway operations use a custom waiter (GatewayReady) built from a waiter
+  model, as the bedrock-agentcore-control service does not provide an
+  official waiter for gateway status changes.
 """
 
 import logging
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError, WaiterError
+from botocore.waiter import WaiterModel, create_waiter_with_client
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-client = boto3.client("bedrock-agentcore-control")
+# Let botocore absorb control plane throttling with adaptive retries
+BOTO_CONFIG = Config(
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    connect_timeout=5,
+    read_timeout=30,
+)
+
+client = boto3.client("bedrock-agentcore-control", config=BOTO_CONFIG)
+
+# Throttling errors are retried by the adaptive retry client; if one still
+# surfaces, retries are exhausted and the error must not be swallowed.
+THROTTLING_ERROR_CODES = {"ThrottlingException", "TooManyRequestsException"}
+
+# ResourceProperties that affect the Cedar Policy or its attachment. Updates
+# that change none of these (e.g. a new ServiceToken) keep the existing policy.
+POLICY_PROPERTIES = (
+    "GatewayIdentifier",
+    "PolicyDocument",
+    "PolicyEngineName",
+    "Description",
+)
 
 # Polling configuration for gateway
 GATEWAY_POLL_INTERVAL_SECONDS = 5
 GATEWAY_TIMEOUT_SECONDS = 300
 
+# Custom waiter model for GetGateway, mirroring the shape of the official
+# policy/policy engine waiters shipped with botocore.
+GATEWAY_WAITER_MODEL = WaiterModel(
+    {
+        "version": 2,
+        "waiters": {
+            "GatewayReady": {
+                "operation": "GetGateway",
+                "delay": GATEWAY_POLL_INTERVAL_SECONDS,
+                "maxAttempts": GATEWAY_TIMEOUT_SECONDS // GATEWAY_POLL_INTERVAL_SECONDS,
+                "acceptors": [
+                    {
+                        "matcher": "path",
+                        "argument": "status",
+                        "expected": "READY",
+                        "state": "success",
+                    },
+                    {
+                        "matcher": "path",
+                        "argument": "status",
+                        "expected": "FAILED",
+                        "state": "failure",
+                    },
+                    {
+                        "matcher": "path",
+                        "argument": "status",
+                        "expected": "UPDATE_UNSUCCESSFUL",
+                        "state": "failure",
+                    },
+                    {
+                        "matcher": "path",
+                        "argument": "status",
+                        "expected": "DELETING",
+                        "state": "failure",
+                    },
+                ],
+            }
+        },
+    }
+)
+
 
 def handler(event: dict, context: dict) -> dict:
     """
@@ -57,8 +124,8 @@ def handler(event: dict, context: dict) -> dict:
     request_type = event["RequestType"]
     props = event["ResourceProperties"]
 
-    logger.info(f"Request type: {request_type}")
-    logger.info(f"Gateway ID: {props['GatewayIdentifier']}")
+    logger.info("Request type: %s", request_type)
+    logger.info("Gateway ID: %s", props["GatewayIdentifier"])
 
     try:
         if request_type == "Create":
@@ -71,7 +138,7 @@ def handler(event: dict, context: dict) -> dict:
             raise ValueError(f"Unknown request type: {request_type}")
 
     except Exception as e:
-        logger.error(f"Error handling {request_type}: {str(e)}", exc_info=True)
+        logger.error("Error handling %s: %s", request_type, e, exc_info=True)
         raise
 
 
@@ -82,7 +149,7 @@ def handle_create(props: dict) -> dict:
     Steps:
       1. Create Policy Engine -> wait for ACTIVE (official waiter)
       2. Create Cedar Policy -> wait for ACTIVE (official waiter)
-      3. Attach Policy Engine to Gateway -> wait for READY (custom polling)
+      3. Attach Policy Engine to Gateway -> wait for READY (custom waiter)
 
     Args:
         props: ResourceProperties from CloudFormation event.
@@ -91,49 +158,30 @@ def handle_create(props: dict) -> dict:
         Response with PhysicalResourceId containing engine and policy IDs.
     """
     gateway_id = props["GatewayIdentifier"]
-    policy_document = props["PolicyDocument"]
-    description = props.get("Description", "Cedar policy for AgentCore Gateway")
     engine_name = props["PolicyEngineName"]
 
     # Step 1: Create Policy Engine
-    logger.info(f"Creating Policy Engine: {engine_name}")
+    logger.info("Creating Policy Engine: %s", engine_name)
     engine_response = client.create_policy_engine(
         name=engine_name,
         description=f"Policy engine for gateway {gateway_id}",
         clientToken=str(uuid.uuid4()),
     )
     policy_engine_id = engine_response["policyEngineId"]
-    logger.info(f"Policy Engine created: {policy_engine_id}")
+    logger.info("Policy Engine created: %s", policy_engine_id)
 
     # Wait for Policy Engine to become ACTIVE using official waiter
-    logger.info(f"Waiting for Policy Engine {policy_engine_id} to become ACTIVE...")
+    logger.info("Waiting for Policy Engine %s to become ACTIVE...", policy_engine_id)
     waiter = client.get_waiter("policy_engine_active")
     waiter.wait(policyEngineId=policy_engine_id)
-    logger.info(f"Policy Engine {policy_engine_id} is now ACTIVE")
+    logger.info("Policy Engine %s is now ACTIVE", policy_engine_id)
 
     # Get the Policy Engine ARN for attaching to gateway
     engine_details = client.get_policy_engine(policyEngineId=policy_engine_id)
     policy_engine_arn = engine_details["policyEngineArn"]
 
     # Step 2: Create Cedar Policy
-    # Policy name format: {engine_name}_cp_{timestamp}
-    # The AgentCore API enforces a 48-character limit on policy names.
-    policy_name = f"{engine_name}_cp_{int(time.time())}"
-    logger.info(f"Creating Cedar Policy: {policy_name}")
-    policy_response = client.create_policy(
-        policyEngineId=policy_engine_id,
-        name=policy_name,
-        description=description,
-        definition={"cedar": {"statement": policy_document}},
-    )
-    policy_id = policy_response["policyId"]
-    logger.info(f"Cedar Policy created: {policy_id}")
-
-    # Wait for Cedar Policy to become ACTIVE using official waiter
-    logger.info(f"Waiting for Cedar Policy {policy_id} to become ACTIVE...")
-    waiter = client.get_waiter("policy_active")
-    waiter.wait(policyEngineId=policy_engine_id, policyId=policy_id)
-    logger.info(f"Cedar Policy {policy_id} is now ACTIVE")
+    policy_id = _create_cedar_policy(policy_engine_id, props)
 
     # Step 3: Attach Policy Engine to Gateway
     _attach_policy_engine_to_gateway(gateway_id, policy_engine_arn)
@@ -156,6 +204,10 @@ def handle_update(event: dict, props: dict) -> dict:
     Update Cedar Policy by deleting all existing managed policies and creating
     a new one with the updated policy document.
 
+    If none of POLICY_PROPERTIES changed and a usable managed policy exists,
+    that policy is kept and only its current ID is looked up, avoiding a
+    delete/create cycle. Otherwise the policy is recreated.
+
     Also verifies the Policy Engine is still attached to the Gateway and
     re-attaches if needed. This handles cases where a previous failed
     deployment rollback may have detached the engine.
@@ -176,38 +228,28 @@ def handle_update(event: dict, props: dict) -> dict:
     policy_engine_id, old_policy_id = physical_id.split("|")
 
     gateway_id = props["GatewayIdentifier"]
-    policy_document = props["PolicyDocument"]
-    description = props.get("Description", "Cedar policy for AgentCore Gateway")
-
-    # Delete all policies managed by this Custom Resource.
-    # The PhysicalResourceId may contain a stale policy ID if handle_update
-    # was called previously (the same PhysicalResourceId is returned to prevent
-    # CloudFormation from triggering a cleanup Delete). The helper first tries
-    # the ID from PhysicalResourceId, then lists and deletes all policies
-    # matching the managed naming convention to clean up any leftovers from
-    # prior updates.
-    _delete_managed_policies(policy_engine_id, old_policy_id, props)
-
-    # Create new policy
-    # Policy name format: {engine_name}_cp_{timestamp}
-    # The AgentCore API enforces a 48-character limit on policy names.
-    engine_name = props["PolicyEngineName"]
-    policy_name = f"{engine_name}_cp_{int(time.time())}"
-    logger.info(f"Creating new Cedar Policy: {policy_name}")
-    policy_response = client.create_policy(
-        policyEngineId=policy_engine_id,
-        name=policy_name,
-        description=description,
-        definition={"cedar": {"statement": policy_document}},
-    )
-    new_policy_id = policy_response["policyId"]
-    logger.info(f"New Cedar Policy created: {new_policy_id}")
-
-    # Wait for new policy to become ACTIVE using official waiter
-    logger.info(f"Waiting for Cedar Policy {new_policy_id} to become ACTIVE...")
-    waiter = client.get_waiter("policy_active")
-    waiter.wait(policyEngineId=policy_engine_id, policyId=new_policy_id)
-    logger.info(f"Cedar Policy {new_policy_id} is now ACTIVE")
+    old_props = event.get("OldResourceProperties", {})
+
+    new_policy_id = None
+    if all(old_props.get(key) == props.get(key) for key in POLICY_PROPERTIES):
+        new_policy_id = _find_current_policy_id(policy_engine_id, props)
+        if new_policy_id:
+            logger.info("Policy properties unchanged, keeping Cedar Policy")
+
+    # Recreate the policy when properties changed or no usable policy exists,
+    # so the ENFORCE-mode engine is never left without a Cedar Policy
+    if new_policy_id is None:
+        # Delete all policies managed by this Custom Resource.
+        # The PhysicalResourceId may contain a stale policy ID if handle_update
+        # was called previously (the same PhysicalResourceId is returned to
+        # prevent CloudFormation from triggering a cleanup Delete). The helper
+        # deletes the ID from PhysicalResourceId along with all policies
+        # matching the managed naming convention to clean up any leftovers
+        # from prior updates.
+        _delete_managed_policies(policy_engine_id, old_policy_id, props)
+
+        # Create new policy
+        new_policy_id = _create_cedar_policy(policy_engine_id, props)
 
     # Verify the Policy Engine is still attached to the Gateway.
     # A previous failed deployment rollback or manual change may have detached it.
@@ -220,7 +262,8 @@ def handle_update(event: dict, props: dict) -> dict:
         logger.warning("Policy Engine is detached from Gateway — re-attaching...")
         engine_details = client.get_policy_engine(policyEngineId=policy_engine_id)
         policy_engine_arn = engine_details["policyEngineArn"]
-        _attach_policy_engine_to_gateway(gateway_id, policy_engine_arn)
+        # Reuse the Gateway details fetched above rather than reading them again
+        _attach_policy_engine_to_gateway(gateway_id, policy_engine_arn, gateway)
         logger.info("Policy Engine re-attached to Gateway successfully")
     else:
         logger.info("Policy Engine is attached to Gateway")
@@ -263,53 +306,168 @@ def handle_delete(event: dict, props: dict) -> dict:
     if "|" in physical_id:
         policy_engine_id, policy_id = physical_id.split("|")
     else:
-        logger.warning(f"Unexpected PhysicalResourceId format: {physical_id}")
+        logger.warning("Unexpected PhysicalResourceId format: %s", physical_id)
         return {"PhysicalResourceId": physical_id}
 
     # Step 1: Detach Policy Engine from Gateway
-    logger.info(f"Detaching Policy Engine from Gateway: {gateway_id}")
+    logger.info("Detaching Policy Engine from Gateway: %s", gateway_id)
     try:
         gateway = client.get_gateway(gatewayIdentifier=gateway_id)
         # Omit policyEngineConfiguration entirely to detach
-        client.update_gateway(
-            gatewayIdentifier=gateway_id,
-            name=gateway.get("name"),
-            roleArn=gateway.get("roleArn"),
-            protocolType=gateway.get("protocolType", "MCP"),
-            authorizerType=gateway.get("authorizerType", "CUSTOM_JWT"),
-            authorizerConfiguration=gateway.get("authorizerConfiguration"),
-        )
+        client.update_gateway(**_gateway_update_args(gateway_id, gateway))
         _wait_for_gateway_ready(gateway_id)
         logger.info("Policy Engine detached from Gateway")
     except Exception as e:
-        logger.warning(f"Could not detach Policy Engine from Gateway: {e}")
+        logger.warning("Could not detach Policy Engine from Gateway: %s", e)
 
     # Step 2: Delete all Cedar Policies managed by this Custom Resource.
     _delete_managed_policies(policy_engine_id, policy_id, props)
 
     # Step 3: Delete Policy Engine
-    logger.info(f"Deleting Policy Engine: {policy_engine_id}")
+    logger.info("Deleting Policy Engine: %s", policy_engine_id)
     try:
         client.delete_policy_engine(policyEngineId=policy_engine_id)
         waiter = client.get_waiter("policy_engine_deleted")
         waiter.wait(policyEngineId=policy_engine_id)
-        logger.info(f"Policy Engine deleted: {policy_engine_id}")
+        logger.info("Policy Engine deleted: %s", policy_engine_id)
     except Exception as e:
-        logger.warning(f"Could not delete Policy Engine {policy_engine_id}: {e}")
+        logger.warning("Could not delete Policy Engine %s: %s", policy_engine_id, e)
 
     return {"PhysicalResourceId": physical_id}
 
 
+def _managed_policy_prefix(engine_name: str) -> str:
+    """
+    Return the name prefix shared by all Cedar policies this resource manages.
+
+    Args:
+        engine_name: The PolicyEngineName resource property.
+
+    Returns:
+        The managed policy name prefix ({engine_name}_cp).
+    """
+    return f"{engine_name}_cp"
+
+
+def _list_managed_policies(policy_engine_id: str, engine_name: str) -> list[dict]:
+    """
+    List every policy in the engine matching the managed naming convention.
+
+    The listing is paginated so engines with more than one page of policies
+    are fully covered.
+
+    Args:
+        policy_engine_id: The Policy Engine identifier.
+        engine_name: The PolicyEngineName resource property.
+
+    Returns:
+        Policy summaries from list_policies whose names carry the managed prefix.
+    """
+    paginator = client.get_paginator("list_policies")
+    pages = paginator.paginate(
+        policyEngineId=policy_engine_id,
+        PaginationConfig={"PageSize": 100},
+    )
+    prefix = _managed_policy_prefix(engine_name)
+    return list(pages.search(f"policies[?starts_with(name, '{prefix}')]"))
+
+
+def _create_cedar_policy(policy_engine_id: str, props: dict) -> str:
+    """
+    Create a Cedar Policy from the resource properties and wait for ACTIVE.
+
+    Args:
+        policy_engine_id: The Policy Engine to create the policy in.
+        props: ResourceProperties containing PolicyEngineName, PolicyDocument
+            and an optional Description.
+
+    Returns:
+        The new policy ID.
+    """
+    # Policy name format: {engine_name}_cp_{timestamp}
+    # The AgentCore API enforces a 48-character limit on policy names.
+    prefix = _managed_policy_prefix(props["PolicyEngineName"])
+    policy_name = f"{prefix}_{int(time.time())}"
+    logger.info("Creating Cedar Policy: %s", policy_name)
+    policy_response = client.create_policy(
+        policyEngineId=policy_engine_id,
+        name=policy_name,
+        description=props.get("Description", "Cedar policy for AgentCore Gateway"),
+        definition={"cedar": {"statement": props["PolicyDocument"]}},
+    )
+    policy_id = policy_response["policyId"]
+    logger.info("Cedar Policy created: %s", policy_id)
+
+    # Wait for Cedar Policy to become ACTIVE using official waiter
+    logger.info("Waiting for Cedar Policy %s to become ACTIVE...", policy_id)
+    waiter = client.get_waiter("policy_active")
+    waiter.wait(policyEngineId=policy_engine_id, policyId=policy_id)
+    logger.info("Cedar Policy %s is now ACTIVE", policy_id)
+    return policy_id
+
+
+def _find_current_policy_id(policy_engine_id: str, props: dict) -> str | None:
+    """
+    Find the ID of the managed Cedar Policy currently in the engine.
+
+    The PhysicalResourceId keeps the policy ID from the original Create, which
+    is stale after any update that replaced the policy. Managed policy names
+    end in a creation timestamp, so the latest usable name is the current
+    policy. Policies that are DELETING or in a *_FAILED state are ignored.
+
+    Args:
+        policy_engine_id: The Policy Engine identifier.
+        props: ResourceProperties containing PolicyEngineName.
+
+    Returns:
+        The current managed policy ID, or None if no usable policy exists.
+    """
+    policies = [
+        p
+        for p in _list_managed_policies(policy_engine_id, props["PolicyEngineName"])
+        if p.get("status") != "DELETING" and not p.get("status", "").endswith("_FAILED")
+    ]
+    if not policies:
+        logger.warning("No usable managed policy found in %s", policy_engine_id)
+        return None
+    return max(policies, key=lambda p: p["name"])["policyId"]
+
+
+def _gateway_update_args(gateway_id: str, gateway: dict) -> dict:
+    """
+    Build the update_gateway arguments that preserve a Gateway's configuration.
+
+    update_gateway replaces the whole Gateway definition, so the existing
+    name, role, protocol and authorizer settings must be passed back unchanged.
+
+    Args:
+        gateway_id: The Gateway identifier.
+        gateway: The get_gateway response for the Gateway.
+
+    Returns:
+        Keyword arguments for update_gateway, excluding policyEngineConfiguration.
+    """
+    return {
+        "gatewayIdentifier": gateway_id,
+        "name": gateway.get("name"),
+        "roleArn": gateway.get("roleArn"),
+        "protocolType": gateway.get("protocolType", "MCP"),
+        "authorizerType": gateway.get("authorizerType", "CUSTOM_JWT"),
+        "authorizerConfiguration": gateway.get("authorizerConfiguration"),
+    }
+
+
 def _delete_managed_policies(
     policy_engine_id: str, known_policy_id: str, props: dict
 ) -> None:
     """
     Delete all Cedar policies managed by this Custom Resource.
 
-    First tries to delete the known policy ID (from PhysicalResourceId). Then
-    lists all policies in the engine and deletes any matching the managed
-    naming convention. This handles stale IDs from prior updates and ensures no
-    orphaned policies remain.
+    Collects the known policy ID (from PhysicalResourceId) together with every
+    policy in the engine matching the managed naming convention, issues all
+    deletes concurrently, and then waits for each deletion to complete. This
+    handles stale IDs from prior updates and ensures no orphaned policies
+    remain, without serialising a full delete-and-wait cycle per policy.
 
     Args:
         policy_engine_id: The Policy Engine identifier.
@@ -317,65 +475,123 @@ def _delete_managed_policies(
         props: ResourceProperties containing PolicyEngineName.
     """
     engine_name = props.get("PolicyEngineName", "")
+    policy_ids = [known_policy_id]
 
-    # Try deleting the known policy ID first
-    logger.info(f"Deleting Cedar Policy: {known_policy_id}")
+    # List any remaining policies matching the managed naming convention. This
+    # catches policies left behind by prior updates where the
+    # PhysicalResourceId contained a stale ID.
     try:
-        client.delete_policy(
-            policyEngineId=policy_engine_id,
-            policyId=known_policy_id,
+        for p in _list_managed_policies(policy_engine_id, engine_name):
+            p_id = p["policyId"]
+            if p_id not in policy_ids:
+                logger.info("Found remaining policy: %s (%s)", p_id, p["name"])
+                policy_ids.append(p_id)
+    except Exception as e:
+        logger.warning("Could not list policies in engine: %s", e)
+
+    # Issue every delete concurrently (boto3 clients are thread-safe) before
+    # waiting, so the deletions proceed in parallel
+    with ThreadPoolExecutor(max_workers=min(8, len(policy_ids))) as executor:
+        issued = executor.map(
+            lambda p_id: _delete_policy(policy_engine_id, p_id), policy_ids
         )
-        waiter = client.get_waiter("policy_deleted")
-        waiter.wait(policyEngineId=policy_engine_id, policyId=known_policy_id)
-        logger.info(f"Policy deleted: {known_policy_id}")
-    except client.exceptions.ResourceNotFoundException:
-        logger.warning(f"Policy {known_policy_id} not found (stale ID)")
+        pending = [p_id for p_id, ok in zip(policy_ids, issued) if ok]
+
+    waiter = client.get_waiter("policy_deleted")
+    for p_id in pending:
+        try:
+            waiter.wait(policyEngineId=policy_engine_id, policyId=p_id)
+            logger.info("Policy deleted: %s", p_id)
+        except WaiterError as e:
+            logger.warning("Could not confirm deletion of policy %s: %s", p_id, e)
+
+
+def _delete_policy(policy_engine_id: str, policy_id: str) -> bool:
+    """
+    Request deletion of a single Cedar policy without waiting for completion.
+
+    Args:
+        policy_engine_id: The Policy Engine identifier.
+        policy_id: The policy to delete.
+
+    Returns:
+        True if the policy is being deleted, False if it was already gone,
+        is in a state that blocks deletion, or the request failed.
+
+    Raises:
+        ClientError: If the request is still throttled after botocore retries.
+    """
+    logger.info("Deleting Cedar Policy: %s", policy_id)
+    try:
+        client.delete_policy(policyEngineId=policy_engine_id, policyId=policy_id)
+        return True
+    except ClientError as e:
+        code = e.response["Error"]["Code"]
+        if code in THROTTLING_ERROR_CODES:
+            raise
+        if code == "ResourceNotFoundException":
+            logger.warning("Policy %s not found (stale ID)", policy_id)
+        elif code == "ConflictException":
+            # Only wait on the policy if the conflict is an in-progress delete;
+            # the policy_deleted waiter never matches CREATING or UPDATING.
+            return _is_policy_deleting(policy_engine_id, policy_id)
+        else:
+            logger.warning("Could not delete policy %s: %s: %s", policy_id, code, e)
     except Exception as e:
-        logger.warning(f"Could not delete policy {known_policy_id}: {e}")
+        logger.warning("Could not delete policy %s: %s", policy_id, e)
+    return False
 
-    # List and delete any remaining policies matching the managed naming
-    # convention. This catches policies left behind by prior updates where the
-    # PhysicalResourceId contained a stale ID.
+
+def _is_policy_deleting(policy_engine_id: str, policy_id: str) -> bool:
+    """
+    Check whether a Cedar policy is already in DELETING status.
+
+    Args:
+        policy_engine_id: The Policy Engine identifier.
+        policy_id: The policy to check.
+
+    Returns:
+        True if the policy is being deleted, False otherwise.
+    """
     try:
-        policies = client.list_policies(policyEngineId=policy_engine_id)
-        for p in policies.get("policies", []):
-            p_id = p["policyId"]
-            p_name = p.get("name", "")
-            if p_name.startswith(f"{engine_name}_cp"):
-                logger.info(f"Deleting remaining policy: {p_id} ({p_name})")
-                try:
-                    client.delete_policy(
-                        policyEngineId=policy_engine_id,
-                        policyId=p_id,
-                    )
-                    waiter = client.get_waiter("policy_deleted")
-                    waiter.wait(policyEngineId=policy_engine_id, policyId=p_id)
-                    logger.info(f"Policy deleted: {p_id}")
-                except Exception as e:
-                    logger.warning(f"Could not delete policy {p_id}: {e}")
+        status = client.get_policy(
+            policyEngineId=policy_engine_id, policyId=policy_id
+        ).get("status")
+    except client.exceptions.ResourceNotFoundException:
+        logger.info("Policy %s was deleted concurrently", policy_id)
+        return False
     except Exception as e:
-        logger.warning(f"Could not list policies in engine: {e}")
+        logger.warning("Could not check status of policy %s: %s", policy_id, e)
+        return False
+
+    if status == "DELETING":
+        logger.info("Policy %s is already being deleted", policy_id)
+        return True
+    logger.warning("Could not delete policy %s in status %s", policy_id, status)
+    return False
 
 
-def _attach_policy_engine_to_gateway(gateway_id: str, policy_engine_arn: str) -> None:
+def _attach_policy_engine_to_gateway(
+    gateway_id: str, policy_engine_arn: str, gateway: dict | None = None
+) -> None:
     """
     Attach a Policy Engine to a Gateway and wait for the Gateway to become READY.
 
     Args:
         gateway_id: The Gateway identifier.
         policy_engine_arn: The Policy Engine ARN to attach.
+        gateway: get_gateway response already held by the caller. Fetched
+            when omitted.
     """
-    logger.info(f"Attaching Policy Engine {policy_engine_arn} to Gateway {gateway_id}")
+    logger.info(
+        "Attaching Policy Engine %s to Gateway %s", policy_engine_arn, gateway_id
+    )
 
-    gateway = client.get_gateway(gatewayIdentifier=gateway_id)
+    if gateway is None:
+        gateway = client.get_gateway(gatewayIdentifier=gateway_id)
 
     client.update_gateway(
-        gatewayIdentifier=gateway_id,
-        name=gateway.get("name"),
-        roleArn=gateway.get("roleArn"),
-        protocolType=gateway.get("protocolType", "MCP"),
-        authorizerType=gateway.get("authorizerType", "CUSTOM_JWT"),
-        authorizerConfiguration=gateway.get("authorizerConfiguration"),
+        **_gateway_update_args(gateway_id, gateway),
         policyEngineConfiguration={
             "arn": policy_engine_arn,
             "mode": "ENFORCE",
@@ -388,35 +604,29 @@ def _attach_policy_engine_to_gateway(gateway_id: str, policy_engine_arn: str) ->
 
 def _wait_for_gateway_ready(gateway_id: str) -> None:
     """
-    Poll until the Gateway reaches READY status.
+    Wait until the Gateway reaches READY status.
 
-    This uses a custom polling loop as the boto3 SDK provides official waiters
-    for Policy Engine and Policy operations (policy_engine_active,
-    policy_engine_deleted, policy_active, policy_deleted) but not for Gateway
-    status changes.
+    The boto3 SDK provides official waiters for Policy Engine and Policy
+    operations (policy_engine_active, policy_engine_deleted, policy_active,
+    policy_deleted) but not for Gateway status changes, so this builds an
+    equivalent waiter from GATEWAY_WAITER_MODEL.
 
     Args:
-        gateway_id: The Gateway identifier to poll.
+        gateway_id: The Gateway identifier to wait on.
 
     Raises:
-        RuntimeError: If the gateway fails or times out.
+        RuntimeError: If the gateway reaches a terminal state, GetGateway
+            fails, or the gateway times out.
     """
-    logger.info(f"Waiting for Gateway {gateway_id} to become READY...")
-    start_time = time.time()
-
-    while time.time() - start_time < GATEWAY_TIMEOUT_SECONDS:
-        gateway = client.get_gateway(gatewayIdentifier=gateway_id)
-        status = gateway.get("status")
-        logger.info(f"Gateway status: {status}")
-
-        if status == "READY":
-            return
-
-        if status in ("FAILED", "UPDATE_UNSUCCESSFUL"):
-            raise RuntimeError(f"Gateway reached terminal state: {status}")
-
-        time.sleep(GATEWAY_POLL_INTERVAL_SECONDS)
-
-    raise RuntimeError(
-        f"Gateway {gateway_id} did not become READY within {GATEWAY_TIMEOUT_SECONDS}s"
-    )
+    logger.info("Waiting for Gateway %s to become READY...", gateway_id)
+    waiter = create_waiter_with_client("GatewayReady", GATEWAY_WAITER_MODEL, client)
+    try:
+        waiter.wait(gatewayIdentifier=gateway_id)
+    except WaiterError as e:
+        # The reason distinguishes a terminal state or GetGateway error from a
+        # timeout ("Max attempts exceeded")
+        status = (e.last_response or {}).get("status")
+        raise RuntimeError(
+            f"Gateway {gateway_id} did not become READY: "
+            f"{e.kwargs.get('reason', e)} (last status: {status})"
+        ) from e
@@ -14,12 +14,38 @@ CloudFormation Events:
 import logging
 
 import boto3
+from botocore.config import Config
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-bedrock_client = boto3.client("bedrock-agentcore-control")
-secrets_client = boto3.client("secretsmanager")
+# Let botocore absorb control plane throttling with adaptive retries
+BOTO_CONFIG = Config(
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    connect_timeout=5,
+    read_timeout=30,
+)
+
+# AWS clients - initialized lazily so each request only pays for the clients
+# it uses (Delete never touches Secrets Manager)
+_bedrock_client = None
+_secrets_client = None
+
+
+def get_bedrock_client():
+    """Get or create Bedrock AgentCore control plane client."""
+    global _bedrock_client
+    if _bedrock_client is None:
+        _bedrock_client = boto3.client("bedrock-agentcore-control", config=BOTO_CONFIG)
+    return _bedrock_client
+
+
+def get_secrets_client():
+    """Get or create Secrets Manager client."""
+    global _secrets_client
+    if _secrets_client is None:
+        _secrets_client = boto3.client("secretsmanager", config=BOTO_CONFIG)
+    return _secrets_client
 
 
 def handler(event: dict, context: dict) -> dict:
@@ -36,8 +62,8 @@ def handler(event: dict, context: dict) -> dict:
     request_type = event["RequestType"]
     props = event["ResourceProperties"]
 
-    logger.info(f"Request type: {request_type}")
-    logger.info(f"Provider name: {props['ProviderName']}")
+    logger.info("Request type: %s", request_type)
+    logger.info("Provider name: %s", props["ProviderName"])
 
     try:
         if request_type == "Create":
@@ -50,10 +76,45 @@ def handler(event: dict, context: dict) -> dict:
             raise ValueError(f"Unknown request type: {request_type}")
 
     except Exception as e:
-        logger.error(f"Error handling {request_type}: {str(e)}", exc_info=True)
+        logger.error("Error handling %s: %s", request_type, e, exc_info=True)
         raise
 
 
+def _get_client_secret(secret_arn: str) -> str:
+    """
+    Retrieve the Cognito client secret from Secrets Manager.
+
+    Args:
+        secret_arn: ARN of the secret holding the client secret
+
+    Returns:
+        The client secret string (never logged)
+    """
+    logger.info("Retrieving secret from: %s", secret_arn)
+    secret_response = get_secrets_client().get_secret_value(SecretId=secret_arn)
+    return secret_response["SecretString"]
+
+
+def _build_provider_config(props: dict, client_secret: str) -> dict:
+    """
+    Build the oauth2ProviderConfigInput shared by create and update calls.
+
+    Args:
+        props: ResourceProperties from CloudFormation event
+        client_secret: Cognito client secret from Secrets Manager
+
+    Returns:
+        CustomOauth2 provider configuration
+    """
+    return {
+        "customOauth2ProviderConfig": {
+            "clientId": props["ClientId"],
+            "clientSecret": client_secret,
+            "oauthDiscovery": {"discoveryUrl": props["DiscoveryUrl"]},
+        }
+    }
+
+
 def handle_create(props: dict) -> dict:
     """
     Create OAuth2 Credential Provider.
@@ -65,29 +126,19 @@ def handle_create(props: dict) -> dict:
         Response with PhysicalResourceId and provider ARN
     """
     # Retrieve client secret from Secrets Manager (not logged)
-    secret_arn = props["ClientSecretArn"]
-    logger.info(f"Retrieving secret from: {secret_arn}")
-
-    secret_response = secrets_client.get_secret_value(SecretId=secret_arn)
-    client_secret = secret_response["SecretString"]
+    client_secret = _get_client_secret(props["ClientSecretArn"])
 
     # Create OAuth2 Credential Provider
-    logger.info(f"Creating OAuth2 provider: {props['ProviderName']}")
+    logger.info("Creating OAuth2 provider: %s", props["ProviderName"])
 
-    response = bedrock_client.create_oauth2_credential_provider(
+    response = get_bedrock_client().create_oauth2_credential_provider(
         name=props["ProviderName"],
         credentialProviderVendor="CustomOauth2",
-        oauth2ProviderConfigInput={
-            "customOauth2ProviderConfig": {
-                "clientId": props["ClientId"],
-                "clientSecret": client_secret,
-                "oauthDiscovery": {"discoveryUrl": props["DiscoveryUrl"]},
-            }
-        },
+        oauth2ProviderConfigInput=_build_provider_config(props, client_secret),
     )
 
     provider_arn = response["credentialProviderArn"]
-    logger.info(f"Created provider with ARN: {provider_arn}")
+    logger.info("Created provider with ARN: %s", provider_arn)
 
     return {
         "PhysicalResourceId": props["ProviderName"],
@@ -107,30 +158,20 @@ def handle_update(event: dict, props: dict) -> dict:
         Response with PhysicalResourceId and provider ARN
     """
     provider_name = event["PhysicalResourceId"]
-    logger.info(f"Updating OAuth2 provider: {provider_name}")
+    logger.info("Updating OAuth2 provider: %s", provider_name)
 
     # Retrieve client secret from Secrets Manager
-    secret_arn = props["ClientSecretArn"]
-    logger.info(f"Retrieving secret from: {secret_arn}")
-
-    secret_response = secrets_client.get_secret_value(SecretId=secret_arn)
-    client_secret = secret_response["SecretString"]
+    client_secret = _get_client_secret(props["ClientSecretArn"])
 
     # Update OAuth2 Credential Provider
-    response = bedrock_client.update_oauth2_credential_provider(
+    response = get_bedrock_client().update_oauth2_credential_provider(
         name=provider_name,
         credentialProviderVendor="CustomOauth2",
-        oauth2ProviderConfigInput={
-            "customOauth2ProviderConfig": {
-                "clientId": props["ClientId"],
-                "clientSecret": client_secret,
-                "oauthDiscovery": {"discoveryUrl": props["DiscoveryUrl"]},
-            }
-        },
+        oauth2ProviderConfigInput=_build_provider_config(props, client_secret),
     )
 
     provider_arn = response["credentialProviderArn"]
-    logger.info(f"Updated provider with ARN: {provider_arn}")
+    logger.info("Updated provider with ARN: %s", provider_arn)
 
     return {
         "PhysicalResourceId": provider_name,
@@ -150,15 +191,16 @@ def handle_delete(event: dict, props: dict) -> dict:
         Response with PhysicalResourceId
     """
     provider_name = event["PhysicalResourceId"]
-    logger.info(f"Deleting OAuth2 provider: {provider_name}")
+    logger.info("Deleting OAuth2 provider: %s", provider_name)
 
+    bedrock_client = get_bedrock_client()
     try:
         bedrock_client.delete_oauth2_credential_provider(name=provider_name)
-        logger.info(f"Deleted provider: {provider_name}")
+        logger.info("Deleted provider: %s", provider_name)
     except bedrock_client.exceptions.ResourceNotFoundException:
-        logger.warning(f"Provider not found (already deleted): {provider_name}")
+        logger.warning("Provider not found (already deleted): %s", provider_name)
     except Exception as e:
-        logger.error(f"Error deleting provider: {str(e)}")
+        logger.error("Error deleting provider: %s", e)
         raise
 
     return {"PhysicalResourceId": provider_name}
@@ -147,6 +147,39 @@ class TestTranscriptionJobManagement:
         with pytest.raises(TranscriptionError, match="timeout"):
             wait_for_transcription_job(job_name="test-job-123", timeout=600)
 
+    @patch("transcriber.get_transcribe_client")
+    @patch("transcriber.time.sleep")
+    def test_wait_for_transcription_job_backoff_is_jittered_and_capped(
+        self, mock_sleep, mock_get_client
+    ):
+        """
+        Given: Transcription job stays in progress for several polls
+        When: wait_for_transcription_job is called
+        Then: Each wait is a 5s floor plus jitter within the capped bound
+        """
+        in_progress = {
+            "TranscriptionJob": {
+                "TranscriptionJobName": "test-job-123",
+                "TranscriptionJobStatus": "IN_PROGRESS",
+            }
+        }
+        completed = {
+            "TranscriptionJob": {
+                "TranscriptionJobName": "test-job-123",
+                "TranscriptionJobStatus": "COMPLETED",
+            }
+        }
+        mock_client = Mock()
+        mock_client.get_transcription_job.side_effect = [in_progress] * 7 + [completed]
+        mock_get_client.return_value = mock_client
+
+        wait_for_transcription_job(job_name="test-job-123", timeout=600)
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 7
+        for attempt, delay in enumerate(delays):
+            assert 5 <= delay <= 5 + min(25, 2**attempt)
+
 
 class TestSegmentation:
     """Tests for transcript segmentation by pauses."""
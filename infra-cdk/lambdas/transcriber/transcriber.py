@@ -9,6 +9,7 @@ Requirements: 2.1, 2.2, 2.3, 2.4
 
 import json
 import os
+import random
 import time
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional
@@ -21,6 +22,11 @@ RAW_VIDEOS_BUCKET = os.environ.get("RAW_VIDEOS_BUCKET")
 TRANSCRIPTS_BUCKET = os.environ.get("TRANSCRIPTS_BUCKET")
 JOBS_TABLE = os.environ.get("JOBS_TABLE")
 
+# Job status polls wait at least MIN_POLL_DELAY_SECONDS plus a jittered
+# backoff of up to MAX_POLL_JITTER_SECONDS
+MIN_POLL_DELAY_SECONDS = 5
+MAX_POLL_JITTER_SECONDS = 25
+
 # AWS clients - initialized lazily
 _s3_client = None
 _transcribe_client = None
@@ -160,6 +166,7 @@ def wait_for_transcription_job(job_name: str, timeout: int = 600) -> Dict[str, A
     """
     transcribe = get_transcribe_client()
     start_time = time.time()
+    attempt = 0
 
     while True:
         try:
@@ -180,8 +187,13 @@ def wait_for_transcription_job(job_name: str, timeout: int = 600) -> Dict[str, A
                     f"Transcription job timeout after {timeout} seconds"
                 )
 
-            # Wait before polling again
-            time.sleep(5)
+            # Fixed floor plus capped exponential jitter, so concurrent jobs
+            # started together do not poll Transcribe in lockstep
+            time.sleep(
+                MIN_POLL_DELAY_SECONDS
+                + random.uniform(0, min(MAX_POLL_JITTER_SECONDS, 2**attempt))
+            )
+            attempt += 1
 
         except ClientError as e:
             error_msg = e.response.get("Error", {}).get("Message", str(e))
@@ -14,16 +14,37 @@ import os
 import subprocess
 import sys
 import tempfile
-import urllib.request
 import zipfile
 from pathlib import Path
 
 import boto3
+import urllib3
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-s3 = boto3.client("s3")
+# S3 client - initialized lazily since Delete requests never upload
+_s3_client = None
+
+# Shared across warm invocations so the CloudFormation response PUT can reuse
+# a pooled connection. Transient 5xx responses are retried so a blip does not
+# leave the stack waiting for the Custom Resource timeout.
+http_pool = urllib3.PoolManager(
+    maxsize=4,
+    retries=urllib3.Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[500, 502, 503, 504],
+    ),
+)
+
+
+def get_s3_client():
+    """Get or create S3 client."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3")
+    return _s3_client
 
 
 def send_response(
@@ -42,6 +63,9 @@ def send_response(
         status: SUCCESS or FAILED.
         reason: Reason for failure.
         physical_resource_id: Physical resource ID.
+
+    Raises:
+        RuntimeError: If the response URL returns a non-2xx status.
     """
     response_body = json.dumps(
         {
@@ -53,16 +77,19 @@ def send_response(
             "LogicalResourceId": event["LogicalResourceId"],
         }
     ).encode("utf-8")
+    logger.info("Sending %s response for %s", status, event["LogicalResourceId"])
 
-    req = urllib.request.Request(
+    response = http_pool.request(
+        "PUT",
         event["ResponseURL"],
-        data=response_body,
+        body=response_body,
         headers={"Content-Type": "application/json"},
-        method="PUT",
-    )
-    urllib.request.urlopen(  # nosemgrep: python.lang.security.audit.dynamic-urllib-use-detected.dynamic-urllib-use-detected  # nosec B310 B113 — URL is the CloudFormation pre-signed ResponseURL, not user-controlled
-        req
     )
+    logger.info("CloudFormation response status: %s", response.status)
+    if not 200 <= response.status < 300:
+        raise RuntimeError(
+            f"Failed to send response to CloudFormation: HTTP {response.status}"
+        )
 
 
 def download_wheels(requirements: list[str], download_dir: Path) -> None:
@@ -73,7 +100,7 @@ def download_wheels(requirements: list[str], download_dir: Path) -> None:
         requirements: List of package specifiers.
         download_dir: Directory to download wheels to.
     """
-    logger.info(f"Downloading wheels for: {requirements}")
+    logger.info("Downloading wheels for: %s", requirements)
 
     # Write requirements to temp file
     req_file = download_dir / "requirements.txt"
@@ -129,7 +156,7 @@ def extract_wheels(download_dir: Path, package_dir: Path) -> None:
         package_dir: Directory to extract to.
     """
     for wheel in download_dir.glob("*.whl"):
-        logger.info(f"Extracting: {wheel.name}")
+        logger.info("Extracting: %s", wheel.name)
         with zipfile.ZipFile(wheel, "r") as whl:
             whl.extractall(package_dir)
 
@@ -160,7 +187,7 @@ def create_deployment_zip(package_dir: Path, output_path: Path) -> None:
         package_dir: Directory to zip.
         output_path: Output ZIP file path.
     """
-    logger.info(f"Creating deployment ZIP: {output_path}")
+    logger.info("Creating deployment ZIP: %s", output_path)
 
     with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
         for root, dirs, files in os.walk(package_dir):
@@ -194,10 +221,14 @@ def handler(event: dict, context) -> None:
         event: CloudFormation Custom Resource event.
         context: Lambda context.
     """
-    logger.info(f"Event: {json.dumps(event)}")
+    # The event embeds every agent source file as base64, so only serialise
+    # the full payload when DEBUG logging is enabled.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Event: %s", json.dumps(event))
 
     request_type = event["RequestType"]
     props = event["ResourceProperties"]
+    logger.info("Request type: %s", request_type)
 
     # On Delete, just succeed since there's nothing to clean up. The bucket handles its own cleanup.
     if request_type == "Delete":
@@ -237,8 +268,8 @@ def handler(event: dict, context) -> None:
             create_deployment_zip(package_dir, zip_path)
 
             # Upload to S3
-            logger.info(f"Uploading to s3://{bucket_name}/{object_key}")
-            s3.upload_file(str(zip_path), bucket_name, object_key)
+            logger.info("Uploading to s3://%s/%s", bucket_name, object_key)
+            get_s3_client().upload_file(str(zip_path), bucket_name, object_key)
 
         send_response(
             event,
@@ -19,7 +19,7 @@ import jwt
 import requests
 from bedrock_agentcore.runtime import RequestContext
 
-from utils.ssm import get_ssm_parameter
+from utils.ssm import get_ssm_parameters
 
 logger = logging.getLogger(__name__)
 
@@ -163,8 +163,11 @@ def get_gateway_access_token(user_id: str) -> str:
     )  # nosemgrep: python.lang.security.audit.logging.logger-credential-leak.python-logger-credential-disclosure
 
     # Get Cognito configuration from SSM and Secrets Manager
-    cognito_domain = get_ssm_parameter(f"/{stack_name}/cognito_provider")
-    client_id = get_ssm_parameter(f"/{stack_name}/machine_client_id")
+    cognito_param = f"/{stack_name}/cognito_provider"
+    client_id_param = f"/{stack_name}/machine_client_id"
+    params = get_ssm_parameters([cognito_param, client_id_param])
+    cognito_domain = params[cognito_param]
+    client_id = params[client_id_param]
     client_secret = get_secret(f"/{stack_name}/machine_client_secret")
 
     logger.info("Cognito domain: %s", cognito_domain)
@@ -1,9 +1,9 @@
 """
 SSM Parameter Store utilities for agent patterns.
 
-Provides a single shared function for fetching parameters from AWS SSM
-Parameter Store, used by agents to retrieve configuration values like
-Gateway URLs that are set during deployment.
+Provides shared functions for fetching parameters from AWS SSM Parameter
+Store, used by agents to retrieve configuration values like Gateway URLs
+that are set during deployment.
 """
 
 import logging
@@ -43,3 +43,34 @@ def get_ssm_parameter(parameter_name: str) -> str:
         raise ValueError(f"SSM parameter not found: {parameter_name}")
     except Exception as e:
         raise ValueError(f"Failed to retrieve SSM parameter {parameter_name}: {e}")
+
+
+def get_ssm_parameters(parameter_names: list[str]) -> dict[str, str]:
+    """
+    Fetch several parameters from AWS SSM Parameter Store in one request.
+
+    Uses a single GetParameters call instead of one GetParameter call per
+    name, saving a network round trip for each additional parameter.
+
+    Args:
+        parameter_names (list[str]): The full SSM parameter names/paths
+            (at most 10, the GetParameters limit).
+
+    Returns:
+        dict[str, str]: Mapping of parameter name to value.
+
+    Raises:
+        ValueError: If any parameter is not found or cannot be retrieved.
+    """
+    region = os.environ.get(
+        "AWS_REGION", os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
+    )
+    ssm = boto3.client("ssm", region_name=region)
+    try:
+        response = ssm.get_parameters(Names=parameter_names)
+    except Exception as e:
+        raise ValueError(f"Failed to retrieve SSM parameters {parameter_names}: {e}")
+
+    if response.get("InvalidParameters"):
+        raise ValueError(f"SSM parameters not found: {response['InvalidParameters']}")
+    return {p["Name"]: p["Value"] for p in response["Parameters"]}
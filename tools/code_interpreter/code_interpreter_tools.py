@@ -2,9 +2,15 @@
 
 import json
 import logging
+import threading
+
+from bedrock_agentcore.tools.code_interpreter_client import CodeInterpreter
 
 logger = logging.getLogger(__name__)
 
+# Compact JSON separators keep the payload returned to the model small
+COMPACT_SEPARATORS = (",", ":")
+
 
 class CodeInterpreterTools:
     """Tools for code execution via AgentCore Code Interpreter."""
@@ -18,15 +24,22 @@ class CodeInterpreterTools:
         """
         self.region = region
         self._code_client = None
+        self._lock = threading.Lock()
 
     def _get_code_interpreter_client(self):
-        """Get or create code interpreter client."""
-        if self._code_client is None:
-            from bedrock_agentcore.tools.code_interpreter_client import CodeInterpreter
+        """
+        Get or create code interpreter client.
 
-            self._code_client = CodeInterpreter(self.region)
-            self._code_client.start()
-            logger.info(f"Started code interpreter in {self.region}")
+        Uses double-checked locking so concurrent tool calls share a single
+        session instead of each starting (and leaking) their own.
+        """
+        if self._code_client is None:
+            with self._lock:
+                if self._code_client is None:
+                    client = CodeInterpreter(self.region)
+                    client.start()
+                    self._code_client = client
+                    logger.info("Started code interpreter in %s", self.region)
         return self._code_client
 
     def cleanup(self):
@@ -36,9 +49,10 @@ class CodeInterpreterTools:
         Note: AgentCore automatically cleans up inactive sessions after timeout,
         so manual cleanup is optional but recommended for immediate resource release.
         """
-        if self._code_client:
-            self._code_client.stop()
-            self._code_client = None
+        with self._lock:
+            if self._code_client:
+                self._code_client.stop()
+                self._code_client = None
 
     def execute_python_securely(self, code: str) -> str:
         """
@@ -57,16 +71,26 @@ class CodeInterpreterTools:
                 {"code": code, "language": "python", "clearContext": False},
             )
 
-            results = []
-            for event in response["stream"]:
-                if "result" in event:
-                    results.append(event["result"])
+            # Drain every event (stdout chunks may precede the final result),
+            # then release the underlying HTTP connection back to the pool
+            stream = response["stream"]
+            try:
+                results = [event["result"] for event in stream if "result" in event]
+            finally:
+                if hasattr(stream, "close"):
+                    stream.close()
 
-            return (
-                json.dumps(results, indent=2)
-                if results
-                else json.dumps({"error": "No results returned"}, indent=2)
+            if not results:
+                return json.dumps(
+                    {"error": "No results returned"}, separators=COMPACT_SEPARATORS
+                )
+            return json.dumps(
+                results[0] if len(results) == 1 else results,
+                separators=COMPACT_SEPARATORS,
             )
         except Exception as e:
-            logger.error(f"Code execution failed: {e}")
-            return json.dumps({"error": f"Code execution failed: {str(e)}"}, indent=2)
+            logger.error("Code execution failed: %s", e)
+            return json.dumps(
+                {"error": f"Code execution failed: {str(e)}"},
+                separators=COMPACT_SEPARATORS,
+            )